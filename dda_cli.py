@@ -17,102 +17,293 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """CLI Draft Assistant for Dota 2"""
 
+import bisect
+import codecs
+import functools
+import heapq
 import io
+import itertools
 import json
-import operator
-from typing import List, Dict, Tuple
+import sys
+from typing import (Any, Callable, FrozenSet, Iterable, List, Dict, Optional,
+                    Set, Tuple)
+
+try:
+    # optional, parses hero data considerably faster than json module
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class Hero:
     """Hero class for storing and accessing hero information."""
 
+    __slots__ = ('name', 'aliases', 'good_against', 'bad_against',
+                 'works_well_with', '_dict', '_pretty')
+
     name: str
-    aliases: List[str]
-    good_against: List[str]
-    bad_against: List[str]
-    works_well_with: List[str]
+    aliases: Tuple[str, ...]
+    good_against: FrozenSet[str]
+    bad_against: FrozenSet[str]
+    works_well_with: FrozenSet[str]
+    _dict: Optional[Dict[str, Any]]
+    _pretty: Optional[str]
 
     def __init__(self, name, aliases, good_against, bad_against,
                  works_well_with):
+        # hero info is immutable after construction, which allows caching
+        # dict and pretty printed representations
+        # relations are sets for cheap membership checks, also dropping any
+        # duplicate entries in hero data
         self.name = name
-        self.aliases = aliases
-        self.good_against = good_against
-        self.bad_against = bad_against
-        self.works_well_with = works_well_with
+        self.aliases = tuple(aliases)
+        self.good_against = frozenset(good_against)
+        self.bad_against = frozenset(bad_against)
+        self.works_well_with = frozenset(works_well_with)
+        self._dict = None
+        self._pretty = None
 
     def dict(self):
-        """Return dictionary representation of hero info."""
-        return {
-            'name': self.name,
-            'aliases': self.aliases,
-            'good_against': self.good_against,
-            'bad_against': self.bad_against,
-            'works_well_with': self.works_well_with,
-        }
+        """Return dictionary representation of hero info.
+
+        Returns a new dict on each call, values are immutable and shared.
+        """
+        if self._dict is None:
+            self._dict = {
+                'name': self.name,
+                'aliases': self.aliases,
+                'good_against': tuple(sorted(self.good_against)),
+                'bad_against': tuple(sorted(self.bad_against)),
+                'works_well_with': tuple(sorted(self.works_well_with)),
+            }
+        # copy so callers modifying the dict cannot corrupt the cached one
+        return dict(self._dict)
 
     def pretty_print(self) -> str:
         """Return human readable string representation of hero info."""
-        return ('Name: ' + self.name + '\n'
+        if self._pretty is None:
+            self._pretty = (
+                'Name: ' + self.name + '\n'
                 'Aliases: ' + ', '.join(self.aliases) + '\n'
-                'Good against: ' + ', '.join(self.good_against) + '\n'
-                'Bad against: ' + ', '.join(self.bad_against) + '\n'
-                'Works well with: ' + ', '.join(self.works_well_with))
+                'Good against: ' + ', '.join(sorted(self.good_against)) + '\n'
+                'Bad against: ' + ', '.join(sorted(self.bad_against)) + '\n'
+                'Works well with: '
+                + ', '.join(sorted(self.works_well_with)))
+        return self._pretty
 
 
 class DraftEngine:
     """Back end engine for draft assistant."""
 
     _hero_data: Dict[str, Hero]
-    _hero_alias_map: Dict[str, str]
     _hero_weights: Dict[str, int]
+    _hero_order: Dict[str, int]
+    _hero_order_key: Callable[[str], int]
+    _weight_buckets: Dict[int, Set[str]]
+    _active_weights: List[int]
+    _ally_deltas: Dict[str, Tuple[Tuple[str, int], ...]]
+    _enemy_deltas: Dict[str, Tuple[Tuple[str, int], ...]]
     _bans: List[str]
     _ally_picks: List[str]
     _enemy_picks: List[str]
+    _bans_set: Set[str]
+    _ally_set: Set[str]
+    _enemy_set: Set[str]
     _max_picks: int = 5
+    _max_candidates_shown: int = 10
 
     def __init__(self, hero_data):
         self._hero_data = {}
-        self._hero_alias_map = {}
 
+        # intern names so that the same string object is shared by hero
+        # data, alias map, relations and picks, making compares cheap
+        intern = sys.intern
         for hero in hero_data["heroes"]:
-            self._hero_data[hero["name"]] = Hero(
-                hero["name"],
-                hero["aliases"],
-                hero["good_against"],
-                hero["bad_against"],
-                hero["works_well_with"],
+            hero_name = intern(hero["name"])
+            self._hero_data[hero_name] = Hero(
+                hero_name,
+                [intern(name) for name in hero["aliases"]],
+                [intern(name) for name in hero["good_against"]],
+                [intern(name) for name in hero["bad_against"]],
+                [intern(name) for name in hero["works_well_with"]],
             )
 
-        for hero_name in self._hero_data:
-            # map each aliases to hero name
-            for hero_alias in self._hero_data[hero_name].aliases:
-                self._hero_alias_map[hero_alias] = hero_name
-
-            # add lowercase hero name as well in case not present
-            self._hero_alias_map[hero_name.lower()] = hero_name
+        self._build_adjacency()
 
         # initialize other instance attributes for start of draft
-        self.reset()
+        self._init_draft_state()
 
-    def reset(self):
-        """Reset engine, clearing picks and resetting hero weights to 0."""
+    @functools.cached_property
+    def _hero_alias_map(self) -> Dict[str, str]:
+        """Return map of lowercase aliases and hero names to hero names.
+
+        Built on first lookup rather than at startup.
+        """
+        # hero name is added as well in case not present in aliases
+        return {
+            hero_alias.lower(): hero_name
+            for hero_name, hero in self._hero_data.items()
+            for hero_alias in (*hero.aliases, hero_name)
+        }
+
+    @functools.cached_property
+    def _alias_keys(self) -> List[str]:
+        """Sorted alias map keys for prefix lookups of hero aliases."""
+        return sorted(self._hero_alias_map)
+
+    def _build_adjacency(self):
+        """Resolve hero relations once into weight deltas of each pick.
+
+        Only heroes present in data are kept, and relations to the same
+        hero are summed into one net delta, dropping those that cancel out.
+        Picks then update weights straight from these tuples without
+        looking up hero info or checking unknown names each time.
+        """
+        def deltas(increase, decrease=()):
+            totals = {}
+            for other_hero in increase:
+                if other_hero in self._hero_data:
+                    totals[other_hero] = totals.get(other_hero, 0) + 1
+            for other_hero in decrease:
+                if other_hero in self._hero_data:
+                    totals[other_hero] = totals.get(other_hero, 0) - 1
+            return tuple((other_hero, delta)
+                         for other_hero, delta in totals.items() if delta)
+
+        self._ally_deltas = {}
+        self._enemy_deltas = {}
+        for hero_name, hero in self._hero_data.items():
+            # ally pick increases weight of heroes it works well with
+            self._ally_deltas[hero_name] = deltas(hero.works_well_with)
+            # enemy pick increases weight of heroes it is bad against and
+            # decreases weight of heroes it is good against
+            self._enemy_deltas[hero_name] = deltas(hero.bad_against,
+                                                   hero.good_against)
+
+    def _init_draft_state(self):
+        """Create containers for picks and weights, then reset them."""
+        # lists keep order for display, sets are for membership checks
         self._bans = []
         self._ally_picks = []
         self._enemy_picks = []
-        self._hero_weights = {}
+        self._bans_set = set()
+        self._ally_set = set()
+        self._enemy_set = set()
+        self._hero_weights = dict.fromkeys(self._hero_data, 0)
+        # position in hero data, orders heroes of equal weight
+        self._hero_order = {hero_name: index
+                            for index, hero_name in enumerate(self._hero_data)}
+        # sort key for selecting heroes from buckets, bound once per draft
+        self._hero_order_key = self._hero_order.__getitem__
+        self._weight_buckets = {}
+        self._active_weights = []
+        self.reset()
 
-        for hero_name in self._hero_data:
+    def reset(self):
+        """Reset engine, clearing picks and resetting hero weights to 0."""
+        # reuse containers in place rather than reallocating each draft
+        self._bans.clear()
+        self._ally_picks.clear()
+        self._enemy_picks.clear()
+        self._bans_set.clear()
+        self._ally_set.clear()
+        self._enemy_set.clear()
+
+        for hero_name in self._hero_weights:
             self._hero_weights[hero_name] = 0
 
+        self._weight_buckets.clear()
+        self._active_weights.clear()
+        if self._hero_weights:
+            self._weight_buckets[0] = set(self._hero_weights)
+            self._active_weights.append(0)
+
+    def _bucket_add(self, hero_name: str, weight: int):
+        """Add hero to weight bucket, activating the bucket if new."""
+        bucket = self._weight_buckets.get(weight)
+        if bucket is None:
+            self._weight_buckets[weight] = {hero_name}
+            bisect.insort(self._active_weights, weight)
+        else:
+            bucket.add(hero_name)
+
+    def _bucket_remove(self, hero_name: str, weight: int):
+        """Remove hero from weight bucket, pruning the bucket if empty."""
+        bucket = self._weight_buckets[weight]
+        bucket.discard(hero_name)
+        if not bucket:
+            del self._weight_buckets[weight]
+            index = bisect.bisect_left(self._active_weights, weight)
+            del self._active_weights[index]
+
+    def _apply_deltas(self, deltas: Iterable[Tuple[str, int]]):
+        """Change weights of heroes in pool by given hero weight deltas.
+
+        Each hero changing weight is moved to the bucket of its new weight.
+        """
+        # bind lookups locally, this loop runs for every related hero
+        hero_weights = self._hero_weights
+        bucket_remove = self._bucket_remove
+        bucket_add = self._bucket_add
+        for hero_name, delta in deltas:
+            weight = hero_weights[hero_name]
+            hero_weights[hero_name] = weight + delta
+            bucket_remove(hero_name, weight)
+            bucket_add(hero_name, weight + delta)
+
     def resolve_hero_name(self, alias: str):
         """Check for lowercase alias in hero alias map.
 
-        Return hero name from map if found, else return None.
+        Return hero name from map if found, or hero name if alias is a prefix
+        of aliases of only one hero, else return None.
+        """
+        return self._resolve_hero(alias)[0]
+
+    def _resolve_hero(self, alias: str) -> Tuple[Optional[str], List[str]]:
+        """Resolve alias to hero name as in resolve_hero_name().
+
+        Also returns names of heroes matching alias as prefix if it did not
+        resolve exactly, for reporting ambiguous aliases.
         """
-        alias = alias.lower()
-        if alias in self._hero_alias_map:
-            return self._hero_alias_map[alias]
-        return None
+        # try alias as typed first, avoiding a lowercase copy in common case
+        hero_name = self._hero_alias_map.get(alias)
+        if hero_name is None:
+            hero_name = self._hero_alias_map.get(alias.lower())
+        if hero_name is not None:
+            return hero_name, []
+
+        candidates = self.hero_name_candidates(alias)
+        if len(candidates) == 1:
+            return candidates[0], candidates
+        return None, candidates
+
+    def hero_name_candidates(self, prefix: str) -> List[str]:
+        """Return sorted names of heroes with an alias starting with prefix."""
+        prefix = prefix.lower()
+        if not prefix:
+            return []
+
+        # aliases sharing prefix are adjacent in sorted alias keys
+        candidates = set()
+        index = bisect.bisect_left(self._alias_keys, prefix)
+        for hero_alias in itertools.islice(self._alias_keys, index, None):
+            if not hero_alias.startswith(prefix):
+                break
+            candidates.add(self._hero_alias_map[hero_alias])
+        return sorted(candidates)
+
+    def _hero_not_found(self, alias: str, candidates: List[str]) -> str:
+        """Return error message for alias not resolving to a hero.
+
+        Candidates are hero names matching alias as prefix, see
+        _resolve_hero().
+        """
+        if len(candidates) > 1:
+            shown = ', '.join(candidates[:self._max_candidates_shown])
+            if len(candidates) > self._max_candidates_shown:
+                shown += f', ... ({len(candidates)} heroes)'
+            return f'Multiple heroes matching {alias}: {shown}'
+        return f'No hero name or alias found matching {alias}'
 
     def ally_hero_pick(self, hero_pick: str) -> Tuple[str, bool]:
         """Process ally hero pick and update hero weights."""
@@ -120,29 +311,24 @@ class DraftEngine:
         if not hero_pick:
             return 'Hero argument required', False
 
-        hero_name = self.resolve_hero_name(hero_pick)
+        hero_name, candidates = self._resolve_hero(hero_pick)
         if not hero_name:
-            return f'No hero name or alias found matching: {hero_pick}', False
+            return self._hero_not_found(hero_pick, candidates), False
 
         if len(self._ally_picks) >= self._max_picks:
             return 'Max ally hero picks reached', False
 
-        if hero_name in self._bans:
+        if hero_name in self._bans_set:
             return f'Hero {hero_name} banned', False
-        if hero_name in self._ally_picks or hero_name in self._enemy_picks:
+        if hero_name in self._ally_set or hero_name in self._enemy_set:
             return f'Hero {hero_name} already picked', False
 
         # passed validation, process pick
         self._ally_picks.append(hero_name)
-
-        # remove picked hero from weights pool
-        if hero_name in self._hero_weights:
-            del self._hero_weights[hero_name]
+        self._ally_set.add(hero_name)
 
         # increase weight of heroes ally pick works well with
-        for other_hero in self._hero_data[hero_name].works_well_with:
-            if other_hero in self._hero_weights:
-                self._hero_weights[other_hero] += 1
+        self._apply_deltas(self._ally_deltas[hero_name])
 
         return f'Ally hero pick: {hero_name}, hero weights updated', True
 
@@ -152,57 +338,124 @@ class DraftEngine:
         if not hero_pick:
             return 'Hero argument required', False
 
-        hero_name = self.resolve_hero_name(hero_pick)
+        hero_name, candidates = self._resolve_hero(hero_pick)
         if not hero_name:
-            return f'No hero name or alias found matching {hero_pick}', False
+            return self._hero_not_found(hero_pick, candidates), False
 
         if len(self._enemy_picks) >= self._max_picks:
             return 'Max enemy hero picks reached', False
 
-        if hero_name in self._bans:
+        if hero_name in self._bans_set:
             return f'Hero {hero_name} banned', False
-        if hero_name in self._ally_picks or hero_name in self._enemy_picks:
+        if hero_name in self._ally_set or hero_name in self._enemy_set:
             return f'Hero {hero_name} already picked', False
 
         # passed validation, process pick
         self._enemy_picks.append(hero_name)
+        self._enemy_set.add(hero_name)
+
+        # decrease weight of heroes enemy pick is good against and increase
+        # weight of heroes enemy pick is bad against
+        self._apply_deltas(self._enemy_deltas[hero_name])
 
-        # remove picked hero from weights pool
-        if hero_name in self._hero_weights:
-            del self._hero_weights[hero_name]
+        return f'Enemy hero pick: {hero_name}, hero weights updated', True
 
-        # decrease weight of heroes enemy pick is good against
-        for other_hero in self._hero_data[hero_name].good_against:
-            if other_hero in self._hero_weights:
-                self._hero_weights[other_hero] -= 1
+    def ally_hero_picks(self, hero_picks: List[str]) -> Tuple[str, bool]:
+        """Process several ally hero picks at once and update hero weights.
 
-        # increase weight of heroes enemy pick is bad against
-        for other_hero in self._hero_data[hero_name].bad_against:
-            if other_hero in self._hero_weights:
-                self._hero_weights[other_hero] += 1
+        Either all picks are processed or, if any fails validation, none.
+        """
+        hero_names, error = self._resolve_picks(hero_picks, 'ally',
+                                                self._ally_picks)
+        if error:
+            return error, False
 
-        return f'Enemy hero pick: {hero_name}, hero weights updated', True
+        # passed validation, process picks
+        self._ally_picks.extend(hero_names)
+        self._ally_set.update(hero_names)
+        self._apply_deltas(self._sum_deltas(self._ally_deltas, hero_names))
+
+        picks_str = ', '.join(hero_names)
+        return f'Ally hero picks: {picks_str}, hero weights updated', True
+
+    def enemy_hero_picks(self, hero_picks: List[str]) -> Tuple[str, bool]:
+        """Process several enemy hero picks at once and update hero weights.
+
+        Either all picks are processed or, if any fails validation, none.
+        """
+        hero_names, error = self._resolve_picks(hero_picks, 'enemy',
+                                                self._enemy_picks)
+        if error:
+            return error, False
+
+        # passed validation, process picks
+        self._enemy_picks.extend(hero_names)
+        self._enemy_set.update(hero_names)
+        self._apply_deltas(self._sum_deltas(self._enemy_deltas, hero_names))
+
+        picks_str = ', '.join(hero_names)
+        return f'Enemy hero picks: {picks_str}, hero weights updated', True
+
+    def _resolve_picks(self, hero_picks: List[str], side: str,
+                       side_picks: List[str]
+                       ) -> Tuple[List[str], Optional[str]]:
+        """Resolve and validate several hero picks for one side.
+
+        Returns list of hero names, and error message if validation failed.
+        """
+        if not hero_picks:
+            return [], 'Hero argument required'
+
+        hero_names = []
+        for hero_pick in hero_picks:
+            if not hero_pick:
+                return [], 'Hero argument required'
+
+            hero_name, candidates = self._resolve_hero(hero_pick)
+            if not hero_name:
+                return [], self._hero_not_found(hero_pick, candidates)
+
+            if hero_name in self._bans_set:
+                return [], f'Hero {hero_name} banned'
+            if hero_name in self._ally_set or hero_name in self._enemy_set:
+                return [], f'Hero {hero_name} already picked'
+            if hero_name in hero_names:
+                return [], f'Hero {hero_name} given more than once'
+            hero_names.append(hero_name)
+
+        if len(side_picks) + len(hero_names) > self._max_picks:
+            return [], f'Picks exceed max {side} hero picks'
+
+        return hero_names, None
+
+    @staticmethod
+    def _sum_deltas(hero_deltas: Dict[str, Tuple[Tuple[str, int], ...]],
+                    hero_names: List[str]) -> List[Tuple[str, int]]:
+        """Sum weight deltas of several picks into one delta per hero."""
+        totals = {}
+        for hero_name in hero_names:
+            for other_hero, delta in hero_deltas[hero_name]:
+                totals[other_hero] = totals.get(other_hero, 0) + delta
+        return [(other_hero, delta)
+                for other_hero, delta in totals.items() if delta]
 
     def ban_hero(self, hero: str) -> Tuple[str, bool]:
         """Ban hero, removing it from pool."""
         if not hero:
             return 'Hero argument required', False
 
-        hero_name = self.resolve_hero_name(hero)
+        hero_name, candidates = self._resolve_hero(hero)
         if not hero_name:
-            return f'No hero name or alias found matching {hero}', False
+            return self._hero_not_found(hero, candidates), False
 
-        if hero_name in self._bans:
+        if hero_name in self._bans_set:
             return f'Hero {hero_name} already banned', False
-        if hero_name in self._ally_picks or hero_name in self._enemy_picks:
+        if hero_name in self._ally_set or hero_name in self._enemy_set:
             return f'Hero {hero_name} already picked', False
 
         # passed validation, process pick
         self._bans.append(hero_name)
-
-        # remove picked hero from weights pool
-        if hero_name in self._hero_weights:
-            del self._hero_weights[hero_name]
+        self._bans_set.add(hero_name)
 
         return f'Hero banned: {hero_name}, hero weights updated', True
 
@@ -212,17 +465,60 @@ class DraftEngine:
         if not hero:
             return 'Hero argument required', False
 
-        hero_name = self.resolve_hero_name(hero)
+        hero_name, candidates = self._resolve_hero(hero)
         if not hero_name:
-            return f'No hero name or alias found matching {hero}', False
+            return self._hero_not_found(hero, candidates), False
 
         return self._hero_data[hero_name].pretty_print(), True
 
-    def sorted_hero_weights(self) -> List[Tuple[str, int]]:
-        """Sort hero weights dict by value in descending order."""
-        sorted_weights = sorted(self._hero_weights.items(),
-                                key=operator.itemgetter(1))
-        return sorted_weights[::-1]
+    def sorted_hero_weights(self, num_best: Optional[int] = None,
+                            num_worst: int = 0
+                            ) -> Tuple[List[Tuple[str, int]],
+                                       List[Tuple[str, int]]]:
+        """Return best and worst hero weights from the pool.
+
+        Best heroes are in descending order of weight, with ties in reverse
+        hero data order, and worst heroes in ascending order, with ties in
+        hero data order. This matches the head of a full descending sort
+        and the reversed tail of it. Banned and picked heroes are not part
+        of the pool. Only the requested number of heroes is read from the
+        weight buckets; if num_best is None, the full pool is returned as
+        best heroes instead.
+        """
+        # weights are kept for all heroes, filter out those not in pool
+        exclude = self._bans_set | self._ally_set | self._enemy_set
+        if num_best is None:
+            num_best = len(self._hero_weights)
+        best = self._collect_hero_weights(reversed(self._active_weights),
+                                          num_best, exclude, heapq.nlargest)
+        worst = self._collect_hero_weights(self._active_weights, num_worst,
+                                           exclude, heapq.nsmallest)
+        return best, worst
+
+    def _collect_hero_weights(self, weights: Iterable[int], limit: int,
+                              exclude: Set[str],
+                              select: Callable[..., List[str]]
+                              ) -> List[Tuple[str, int]]:
+        """Walk weight buckets in given order until limit heroes collected.
+
+        Heroes in exclude are skipped. Within a bucket, heroes are chosen
+        by select (heapq.nlargest or heapq.nsmallest) on hero data order.
+        """
+        collected = []
+        key = self._hero_order_key
+        for weight in weights:
+            remaining = limit - len(collected)
+            if remaining <= 0:
+                break
+            bucket = self._weight_buckets[weight]
+            hero_names = select(
+                remaining,
+                (hero_name for hero_name in bucket
+                 if hero_name not in exclude),
+                key=key)
+            for hero_name in hero_names:
+                collected.append((hero_name, weight))
+        return collected
 
     @property
     def bans(self) -> List[str]:
@@ -244,10 +540,26 @@ class DraftCLI:
     """Command line interface for draft engine."""
 
     _draft_engine: DraftEngine
+    _commands: Dict[str, Callable[[str], bool]]
     _prompt_str: str = "> "
 
-    def __init__(self, hero_data):
-        self._draft_engine = DraftEngine(hero_data)
+    def __init__(self, draft_engine: DraftEngine):
+        self._draft_engine = draft_engine
+
+        # map each command alias to handler taking command params
+        self._commands = {
+            'h': self._cmd_help, 'help': self._cmd_help,
+            'q': self._cmd_quit, 'quit': self._cmd_quit,
+            'r': self._cmd_reset, 'reset': self._cmd_reset,
+            's': self._cmd_status, 'status': self._cmd_status,
+            'a': self._cmd_ally, 'ally': self._cmd_ally,
+            'e': self._cmd_enemy, 'enemy': self._cmd_enemy,
+            'aa': self._cmd_ally_multi,
+            'ee': self._cmd_enemy_multi,
+            'b': self._cmd_ban, 'ban': self._cmd_ban,
+            'i': self._cmd_info, 'info': self._cmd_info,
+        }
+
         print('Draft engine initialized')
         self._help()
 
@@ -264,46 +576,84 @@ class DraftCLI:
 
         Returns boolean for whether to continue prompting or exit.
         """
-        cmd_split = cmd.split()
+        # split off command base only, params are passed on as typed
+        cmd_split = cmd.strip().split(None, 1)
         if not cmd_split:
             return True
 
         cmd_base = cmd_split[0]
-        if len(cmd_split) > 1:
-            cmd_params = ' '.join(cmd_split[1:])
+        if len(cmd_split) == 2:
+            cmd_params = cmd_split[1]
         else:
             cmd_params = ''
 
-        if cmd_base in ('h', 'help'):
-            self._help()
-        elif cmd_base in ('q', 'quit'):
-            print('Quitting')
-            return False
-        elif cmd_base in ('r', 'reset'):
-            self._draft_engine.reset()
-            print('Reset draft engine')
-        elif cmd_base in ('s', 'status'):
+        handler = self._commands.get(cmd_base, self._cmd_invalid)
+        return handler(cmd_params)
+
+    # command handlers take command params and return boolean for whether to
+    # continue prompting or exit
+
+    def _cmd_help(self, _params: str) -> bool:
+        self._help()
+        return True
+
+    @staticmethod
+    def _cmd_quit(_params: str) -> bool:
+        print('Quitting')
+        return False
+
+    def _cmd_reset(self, _params: str) -> bool:
+        self._draft_engine.reset()
+        print('Reset draft engine')
+        return True
+
+    def _cmd_status(self, _params: str) -> bool:
+        self._display_hero_weights()
+        return True
+
+    def _cmd_ally(self, params: str) -> bool:
+        out, success = self._draft_engine.ally_hero_pick(params)
+        print(out)
+        if success:
             self._display_hero_weights()
-        elif cmd_base in ('a', 'ally'):
-            out, success = self._draft_engine.ally_hero_pick(cmd_params)
-            print(out)
-            if success:
-                self._display_hero_weights()
-        elif cmd_base in ('e', 'enemy'):
-            out, success = self._draft_engine.enemy_hero_pick(cmd_params)
-            print(out)
-            if success:
-                self._display_hero_weights()
-        elif cmd_base in ('b', 'ban'):
-            out, success = self._draft_engine.ban_hero(cmd_params)
-            print(out)
-        elif cmd_base in ('i', 'info'):
-            out, success = self._draft_engine.hero_info(cmd_params)
-            print(out)
-        else:
-            print('Invalid command')
-            self._help()
+        return True
 
+    def _cmd_enemy(self, params: str) -> bool:
+        out, success = self._draft_engine.enemy_hero_pick(params)
+        print(out)
+        if success:
+            self._display_hero_weights()
+        return True
+
+    def _cmd_ally_multi(self, params: str) -> bool:
+        hero_picks = [hero_pick.strip() for hero_pick in params.split(',')]
+        out, success = self._draft_engine.ally_hero_picks(hero_picks)
+        print(out)
+        if success:
+            self._display_hero_weights()
+        return True
+
+    def _cmd_enemy_multi(self, params: str) -> bool:
+        hero_picks = [hero_pick.strip() for hero_pick in params.split(',')]
+        out, success = self._draft_engine.enemy_hero_picks(hero_picks)
+        print(out)
+        if success:
+            self._display_hero_weights()
+        return True
+
+    def _cmd_ban(self, params: str) -> bool:
+        out, _ = self._draft_engine.ban_hero(params)
+        print(out)
+        return True
+
+    def _cmd_info(self, params: str) -> bool:
+        out, _ = self._draft_engine.hero_info(params)
+        print(out)
+        return True
+
+    def _cmd_invalid(self, _params: str) -> bool:
+        print('Invalid command')
+        self._help()
         return True
 
     @staticmethod
@@ -317,32 +667,36 @@ class DraftCLI:
         b <hero>, ban <hero>      ban hero from pool
         a <hero>, ally <hero>     ally hero pick
         e <hero>, enemy <hero>    enemy hero pick
+        aa <hero>,<hero>,...      multiple ally hero picks
+        ee <hero>,<hero>,...      multiple enemy hero picks
         i <hero>, info <hero>     show hero info""")
 
     def _display_hero_weights(self):
         """Print out subset of hero weights, showing best and worst picks."""
-        weights = self._draft_engine.sorted_hero_weights()
-        num_heroes = len(weights)
-
-        # default list 10 best heroes and 5 worst
+        # default list 15 best heroes and 5 worst
         # in the future, add commands for configuring values
         num_best = 15
         num_worst = 5
-        assert num_heroes >= num_best
-        assert num_heroes >= num_worst
-
-        print('Status:')
-        print('Bans: ' + ', '.join(self._draft_engine.bans))
-        print('Enemy picks: ' + ', '.join(self._draft_engine.enemy_picks))
-        print('Ally picks: ' + ', '.join(self._draft_engine.ally_picks))
-
-        print(f'{num_best} best picks and {num_worst} worst picks:')
-        for i in range(0, num_best):
-            print(f'  {weights[i][1]}, {weights[i][0]}')
-
-        print('...')
-        for i in range(num_heroes - num_worst, num_heroes):
-            print(f'  {weights[i][1]}, {weights[i][0]}')
+        best, worst = self._draft_engine.sorted_hero_weights(num_best,
+                                                             num_worst)
+
+        # build whole status output and write it out at once
+        out = [
+            'Status:',
+            'Bans: ' + ', '.join(self._draft_engine.bans),
+            'Enemy picks: ' + ', '.join(self._draft_engine.enemy_picks),
+            'Ally picks: ' + ', '.join(self._draft_engine.ally_picks),
+            f'{num_best} best picks and {num_worst} worst picks:',
+        ]
+        for hero_name, weight in best:
+            out.append(f'  {weight}, {hero_name}')
+
+        # worst picks are listed last, continuing the descending order
+        out.append('...')
+        for hero_name, weight in reversed(worst):
+            out.append(f'  {weight}, {hero_name}')
+
+        sys.stdout.write('\n'.join(out) + '\n')
 
     def run(self):
         """Run CLI, looping prompt until exit."""
@@ -350,18 +704,37 @@ class DraftCLI:
             pass
 
 
+def _parse_hero_data(data: bytes) -> Dict[str, Any]:
+    """Parse hero data JSON, with orjson if available."""
+    # hero data files may be saved with a UTF-8 byte order mark
+    if data.startswith(codecs.BOM_UTF8):
+        data = data[len(codecs.BOM_UTF8):]
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def load_draft_engine(hero_data_file: str) -> DraftEngine:
+    """Create draft engine from hero data file.
+
+    Raises FileNotFoundError if hero data file does not exist.
+    """
+    with io.open(hero_data_file, 'rb') as json_file:
+        hero_data = _parse_hero_data(json_file.read())
+    return DraftEngine(hero_data)
+
+
 def main():
     """Main for running DDA CLI."""
     # TODO: add argument handling for different file name
     hero_data_file = 'hero_data.json'
     try:
-        with io.open(hero_data_file, 'r', encoding='utf-8-sig') as json_file:
-            hero_data = json.load(json_file)
+        draft_engine = load_draft_engine(hero_data_file)
     except FileNotFoundError:
         print(f'error: file {hero_data_file} not found')
         return
 
-    draft_cli = DraftCLI(hero_data)
+    draft_cli = DraftCLI(draft_engine)
     draft_cli.run()
 
 
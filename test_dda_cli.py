@@ -0,0 +1,228 @@
+"""Tests for DDA CLI draft engine"""
+
+import codecs
+import json
+import operator
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import dda_cli
+
+
+def _hero(name, aliases=(), good_against=(), bad_against=(),
+          works_well_with=()):
+    return {
+        'name': name,
+        'aliases': list(aliases),
+        'good_against': list(good_against),
+        'bad_against': list(bad_against),
+        'works_well_with': list(works_well_with),
+    }
+
+
+HERO_DATA = {
+    'heroes': [
+        _hero('Anti-Mage', ['antimage', 'am'], ['Lina'], ['Lion'], ['Lion']),
+        _hero('Lina', ['lina'], ['Lion'], ['Anti-Mage'], ['Lion', 'Luna']),
+        _hero('Lion', ['lion'], ['Luna'], ['Lina'], ['Lina']),
+        _hero('Luna', ['luna'], [], ['Lion', 'Lina'], ['Anti-Mage']),
+        _hero('Sven', ['sven'], ['Luna'], ['Anti-Mage'], ['Lina']),
+        _hero('Tiny', ['tiny'], ['Lina'], [], ['Sven']),
+    ]
+}
+
+
+class HeroWeightOrderTest(unittest.TestCase):
+    """Best and worst heroes match a full sort of weights, ties included."""
+
+    num_heroes = 30
+
+    def setUp(self):
+        # names out of alphabetical order, so ordering ties by name would
+        # differ from ordering them by position in hero data
+        names = [f'Hero {i * 7 % self.num_heroes:02}'
+                 for i in range(self.num_heroes)]
+
+        def related(index, offsets):
+            return [names[(index + offset) % self.num_heroes]
+                    for offset in offsets]
+
+        self.hero_data = {'heroes': [
+            _hero(name, [], related(i, (3,)), related(i, (11, 5)),
+                  related(i, (1, 7)))
+            for i, name in enumerate(names)
+        ]}
+        self.names = names
+        self.engine = dda_cli.DraftEngine(self.hero_data)
+
+    def _expected_weights(self, allies, enemies, bans):
+        """Sort weights as the original engine did, in descending order."""
+        heroes = {hero['name']: hero for hero in self.hero_data['heroes']}
+        weights = dict.fromkeys(self.names, 0)
+        for hero_name in allies:
+            for other_hero in heroes[hero_name]['works_well_with']:
+                weights[other_hero] += 1
+        for hero_name in enemies:
+            for other_hero in heroes[hero_name]['good_against']:
+                weights[other_hero] -= 1
+            for other_hero in heroes[hero_name]['bad_against']:
+                weights[other_hero] += 1
+        for hero_name in allies + enemies + bans:
+            del weights[hero_name]
+        return sorted(weights.items(), key=operator.itemgetter(1))[::-1]
+
+    def test_matches_full_sort_after_picks(self):
+        allies = [self.names[0], self.names[10]]
+        enemies = [self.names[4], self.names[20]]
+        bans = [self.names[15]]
+        for hero_name in allies:
+            self.engine.ally_hero_pick(hero_name)
+        for hero_name in enemies:
+            self.engine.enemy_hero_pick(hero_name)
+        for hero_name in bans:
+            self.engine.ban_hero(hero_name)
+
+        expected = self._expected_weights(allies, enemies, bans)
+        # ties across both cutoffs, so tie order decides who is shown
+        self.assertEqual(expected[14][1], expected[15][1])
+        self.assertEqual(expected[-5][1], expected[-6][1])
+
+        best, worst = self.engine.sorted_hero_weights(15, 5)
+        self.assertEqual(best, expected[:15])
+        self.assertEqual(worst[::-1], expected[-5:])
+
+    def test_matches_full_sort_at_start(self):
+        expected = self._expected_weights([], [], [])
+        best, worst = self.engine.sorted_hero_weights(15, 5)
+        self.assertEqual(best, expected[:15])
+        self.assertEqual(worst[::-1], expected[-5:])
+
+
+class BatchPickTest(unittest.TestCase):
+    """Batch picks update weights like the same picks made one by one."""
+
+    def setUp(self):
+        self.engine = dda_cli.DraftEngine(HERO_DATA)
+
+    def test_ally_picks_match_single_picks(self):
+        single = dda_cli.DraftEngine(HERO_DATA)
+        single.ally_hero_pick('lina')
+        single.ally_hero_pick('sven')
+
+        out, success = self.engine.ally_hero_picks(['lina', 'sven'])
+        self.assertTrue(success, out)
+        self.assertEqual(self.engine.ally_picks, ['Lina', 'Sven'])
+        self.assertEqual(self.engine.sorted_hero_weights(),
+                         single.sorted_hero_weights())
+
+    def test_enemy_picks_match_single_picks(self):
+        single = dda_cli.DraftEngine(HERO_DATA)
+        single.enemy_hero_pick('luna')
+        single.enemy_hero_pick('am')
+
+        out, success = self.engine.enemy_hero_picks(['luna', 'am'])
+        self.assertTrue(success, out)
+        self.assertEqual(self.engine.enemy_picks, ['Luna', 'Anti-Mage'])
+        self.assertEqual(self.engine.sorted_hero_weights(),
+                         single.sorted_hero_weights())
+
+    def test_duplicate_in_batch(self):
+        out, success = self.engine.ally_hero_picks(['lina', 'Lina'])
+        self.assertFalse(success)
+        self.assertEqual(out, 'Hero Lina given more than once')
+        self.assertEqual(self.engine.ally_picks, [])
+
+    def test_failed_batch_applies_nothing(self):
+        self.engine.ban_hero('tiny')
+        out, success = self.engine.ally_hero_picks(['lina', 'tiny'])
+        self.assertFalse(success)
+        self.assertEqual(out, 'Hero Tiny banned')
+        self.assertEqual(self.engine.ally_picks, [])
+        best, _ = self.engine.sorted_hero_weights()
+        self.assertTrue(all(weight == 0 for _, weight in best))
+
+    def test_max_picks(self):
+        self.engine.ally_hero_pick('tiny')
+        out, success = self.engine.ally_hero_picks(
+            ['am', 'lina', 'lion', 'luna', 'sven'])
+        self.assertFalse(success)
+        self.assertEqual(out, 'Picks exceed max ally hero picks')
+
+
+class ResolveHeroTest(unittest.TestCase):
+    """Hero names resolve by alias, case-insensitively and by prefix."""
+
+    def setUp(self):
+        self.engine = dda_cli.DraftEngine(HERO_DATA)
+
+    def test_exact(self):
+        self.assertEqual(self.engine.resolve_hero_name('am'), 'Anti-Mage')
+        self.assertEqual(self.engine.resolve_hero_name('AM'), 'Anti-Mage')
+        self.assertEqual(self.engine.resolve_hero_name('anti-mage'),
+                         'Anti-Mage')
+
+    def test_unique_prefix(self):
+        self.assertEqual(self.engine.resolve_hero_name('anti'), 'Anti-Mage')
+        self.assertEqual(self.engine.resolve_hero_name('Sv'), 'Sven')
+
+    def test_ambiguous_prefix(self):
+        self.assertIsNone(self.engine.resolve_hero_name('li'))
+        out, success = self.engine.hero_info('li')
+        self.assertFalse(success)
+        self.assertEqual(out, 'Multiple heroes matching li: Lina, Lion')
+
+    def test_ambiguous_prefix_list_capped(self):
+        heroes = [_hero(f'Hero {i:02}') for i in range(15)]
+        engine = dda_cli.DraftEngine({'heroes': heroes})
+        out, success = engine.hero_info('hero')
+        self.assertFalse(success)
+        self.assertEqual(out.count('Hero '), 10)
+        self.assertTrue(out.endswith(', ... (15 heroes)'), out)
+
+    def test_not_found(self):
+        self.assertIsNone(self.engine.resolve_hero_name('zz'))
+        out, success = self.engine.ban_hero('zz')
+        self.assertFalse(success)
+        self.assertEqual(out, 'No hero name or alias found matching zz')
+
+
+class LoadDraftEngineTest(unittest.TestCase):
+    """Draft engine loads from hero data file."""
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp_dir.cleanup)
+        self.data_file = os.path.join(self._tmp_dir.name, 'hero_data.json')
+
+    def test_load(self):
+        with open(self.data_file, 'w', encoding='utf-8') as data_file:
+            json.dump(HERO_DATA, data_file)
+
+        engine = dda_cli.load_draft_engine(self.data_file)
+        self.assertEqual(engine.resolve_hero_name('am'), 'Anti-Mage')
+
+    def test_missing_data_file(self):
+        with self.assertRaises(FileNotFoundError):
+            dda_cli.load_draft_engine(self.data_file)
+
+    def _load_with_bom(self):
+        with open(self.data_file, 'wb') as data_file:
+            data_file.write(codecs.BOM_UTF8
+                            + json.dumps(HERO_DATA).encode('utf-8'))
+        return dda_cli.load_draft_engine(self.data_file)
+
+    @unittest.skipIf(dda_cli.orjson is None, 'orjson not installed')
+    def test_byte_order_mark_orjson(self):
+        engine = self._load_with_bom()
+        self.assertEqual(engine.resolve_hero_name('am'), 'Anti-Mage')
+
+    def test_byte_order_mark_json(self):
+        with mock.patch.object(dda_cli, 'orjson', None):
+            engine = self._load_with_bom()
+        self.assertEqual(engine.resolve_hero_name('am'), 'Anti-Mage')
+
+
+if __name__ == '__main__':
+    unittest.main()